@@ -141,11 +141,35 @@ class PerformanceDatabase:
             yield conn
         finally:
             conn.close()
-    
-    def start_monitoring_run(self, tool_name: str, parameters: Dict[str, Any] = None, 
-                           repository_path: str = None, notes: str = None) -> int:
-        """Start a new monitoring run and return the run ID"""
+
+    @contextmanager
+    def transaction(self):
+        """
+        Context manager for batching several write calls into one transaction
+
+        Pass the yielded connection to the record/start/finish methods via
+        their `conn` parameter so the whole batch commits (and fsyncs) once
+        instead of once per call. Rolls back automatically on error.
+        """
         with self.get_connection() as conn:
+            with conn:  # sqlite3 connection context: commit once on success
+                yield conn
+
+    @contextmanager
+    def _write_connection(self, conn: sqlite3.Connection = None):
+        """Yield the caller's connection, or open one and commit on success"""
+        if conn is not None:
+            yield conn
+        else:
+            with self.get_connection() as own:
+                yield own
+                own.commit()
+
+    def start_monitoring_run(self, tool_name: str, parameters: Dict[str, Any] = None,
+                           repository_path: str = None, notes: str = None,
+                           conn: sqlite3.Connection = None) -> int:
+        """Start a new monitoring run and return the run ID"""
+        with self._write_connection(conn) as conn:
             cursor = conn.execute('''
                 INSERT INTO monitoring_runs (run_date, tool_name, parameters, repository_path, notes)
                 VALUES (?, ?, ?, ?, ?)
@@ -156,22 +180,22 @@ class PerformanceDatabase:
                 repository_path,
                 notes
             ))
-            conn.commit()
             return cursor.lastrowid
-    
-    def finish_monitoring_run(self, run_id: int, duration_seconds: int):
+
+    def finish_monitoring_run(self, run_id: int, duration_seconds: int,
+                            conn: sqlite3.Connection = None):
         """Update monitoring run with completion information"""
-        with self.get_connection() as conn:
+        with self._write_connection(conn) as conn:
             conn.execute('''
-                UPDATE monitoring_runs 
-                SET duration_seconds = ? 
+                UPDATE monitoring_runs
+                SET duration_seconds = ?
                 WHERE id = ?
             ''', (duration_seconds, run_id))
-            conn.commit()
-    
-    def record_memory_measurement(self, run_id: int, measurement_data: Dict[str, Any]):
+
+    def record_memory_measurement(self, run_id: int, measurement_data: Dict[str, Any],
+                                conn: sqlite3.Connection = None):
         """Record a memory measurement"""
-        with self.get_connection() as conn:
+        with self._write_connection(conn) as conn:
             conn.execute('''
                 INSERT INTO memory_measurements (
                     run_id, timestamp, process_id, process_name, process_type,
@@ -192,11 +216,39 @@ class PerformanceDatabase:
                 measurement_data.get('is_copilot_related', False),
                 measurement_data.get('is_extension_host', False)
             ))
-            conn.commit()
-    
-    def record_repository_analysis(self, run_id: int, analysis_data: Dict[str, Any]) -> int:
+
+    def record_memory_measurements(self, run_id: int, measurements: List[Dict[str, Any]],
+                                 conn: sqlite3.Connection = None):
+        """Record a batch of memory measurements with a single executemany"""
+        with self._write_connection(conn) as conn:
+            conn.executemany('''
+                INSERT INTO memory_measurements (
+                    run_id, timestamp, process_id, process_name, process_type,
+                    memory_rss_mb, memory_growth_mb, cpu_percent, open_files, threads,
+                    is_copilot_related, is_extension_host
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (
+                    run_id,
+                    m.get('timestamp', datetime.now()),
+                    m['process_id'],
+                    m['process_name'],
+                    m['process_type'],
+                    m['memory_rss_mb'],
+                    m.get('memory_growth_mb', 0),
+                    m.get('cpu_percent', 0),
+                    m.get('open_files', 0),
+                    m.get('threads', 0),
+                    m.get('is_copilot_related', False),
+                    m.get('is_extension_host', False)
+                )
+                for m in measurements
+            ])
+
+    def record_repository_analysis(self, run_id: int, analysis_data: Dict[str, Any],
+                                 conn: sqlite3.Connection = None) -> int:
         """Record repository analysis results"""
-        with self.get_connection() as conn:
+        with self._write_connection(conn) as conn:
             cursor = conn.execute('''
                 INSERT INTO repository_analysis (
                     run_id, analysis_date, repository_path, total_files, total_size_mb,
@@ -212,7 +264,6 @@ class PerformanceDatabase:
                 analysis_data.get('git_tracked_files'),
                 json.dumps(analysis_data.get('full_results', {}))
             ))
-            conn.commit()
             return cursor.lastrowid
     
     def get_memory_trends(self, run_id: int, process_type: str = None) -> List[Dict]:
@@ -331,14 +382,6 @@ def example_usage():
     # Initialize database
     db = PerformanceDatabase("example_performance.db")
     
-    # Start a monitoring run
-    run_id = db.start_monitoring_run(
-        tool_name="test.py",
-        parameters={"mode": "copilot-focused", "interval": 5},
-        repository_path="/path/to/large/repo",
-        notes="Testing memory patterns with new Copilot features"
-    )
-    
     # Record some sample measurements
     sample_measurements = [
         {
@@ -363,12 +406,21 @@ def example_usage():
         }
     ]
     
-    for measurement in sample_measurements:
-        db.record_memory_measurement(run_id, measurement)
-    
-    # Finish the run
-    db.finish_monitoring_run(run_id, duration_seconds=300)
-    
+    # Batch the run bookkeeping and all measurements into one transaction
+    # so the database commits (and fsyncs) once instead of once per call
+    with db.transaction() as conn:
+        run_id = db.start_monitoring_run(
+            tool_name="test.py",
+            parameters={"mode": "copilot-focused", "interval": 5},
+            repository_path="/path/to/large/repo",
+            notes="Testing memory patterns with new Copilot features",
+            conn=conn
+        )
+
+        db.record_memory_measurements(run_id, sample_measurements, conn=conn)
+
+        db.finish_monitoring_run(run_id, duration_seconds=300, conn=conn)
+
     # Query the data
     trends = db.get_memory_trends(run_id, process_type='Extension Host')
     recent_runs = db.get_recent_runs(tool_name="test.py")
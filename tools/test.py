@@ -4,46 +4,112 @@ VS Code Memory Usage Monitor
 A script to monitor memory usage of VS Code processes on macOS
 """
 
-import psutil
+import io
 import time
 import sys
-from datetime import datetime
+from operator import itemgetter
+
+# Shared memory thresholds. The same cut-offs recur across several report and
+# monitoring functions; naming them centralizes tuning and keeps each
+# comparison against a single precomputed int constant.
+MB_100 = 100 << 20
+MB_200 = 200 << 20
+MB_500 = 500 << 20
+GB_2 = 2 << 30
+GB_3 = 3 << 30
+
+# Set by -y/--yes so automated runs (CI, benchmarking harnesses) never block
+# on an interactive prompt
+# Two-slot icon table indexed by a boolean: avoids re-evaluating a
+# conditional expression in the per-row print loops
+_ICONS = ("📊", "🔥")
+
+ASSUME_YES = False
+
+# Set by --interval/--duration so scripted runs can override each mode's
+# built-in timing without being prompted; None means "use the mode default"
+MONITOR_INTERVAL = None
+MONITOR_DURATION = None
+
+
+def confirm(prompt):
+    """Ask for confirmation; always true when -y/--yes was given"""
+    return ASSUME_YES or input(prompt).lower() in ('y', 'yes')
+
+def extract_int_option(argv, name):
+    """Remove `name N` or `name=N` from argv, returning (argv, value or None)"""
+    remaining = []
+    value = None
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == name and i + 1 < len(argv):
+            try:
+                value = int(argv[i + 1])
+            except ValueError:
+                print(f"❌ Invalid value for {name}. Using mode default")
+            i += 2
+            continue
+        if arg.startswith(name + '='):
+            try:
+                value = int(arg.split('=', 1)[1])
+            except ValueError:
+                print(f"❌ Invalid value for {name}. Using mode default")
+            i += 1
+            continue
+        remaining.append(arg)
+        i += 1
+    return remaining, value
+
+# Short-lived cache for get_vscode_processes: modes that snapshot and then
+# immediately analyze reuse one process scan, while the TTL stays well below
+# any monitoring interval so long-running loops always rescan
+_PROCESS_SCAN_TTL = 0.5
+_process_scan_cache = {'time': float('-inf'), 'data': None}
 
 def get_vscode_processes():
     """Find all VS Code related processes with detailed info"""
+    import psutil
+    now = time.monotonic()
+    if now - _process_scan_cache['time'] < _PROCESS_SCAN_TTL:
+        return _process_scan_cache['data']
+
     vscode_processes = []
-    
-    for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'cpu_percent', 'cmdline', 'create_time']):
-        try:
-            proc_info = proc.info
-            proc_name = proc_info['name'].lower()
-            
-            # Look for VS Code related processes
-            if any(keyword in proc_name for keyword in [
-                'code', 'electron', 'visual studio code'
-            ]):
-                # Additional check to make sure it's actually VS Code
-                try:
-                    cmdline = proc.cmdline()
-                    if any('visual studio code' in arg.lower() or 
-                          'vscode' in arg.lower() or
-                          'code' in arg.lower() for arg in cmdline):
-                        
-                        # Determine process type based on command line arguments
-                        process_type = determine_process_type(cmdline, proc_name)
-                        
-                        vscode_processes.append({
-                            'process': proc,
-                            'type': process_type,
-                            'name': proc_info['name'],
-                            'cmdline': cmdline
-                        })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-                    
-        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-            continue
-    
+
+    # ad_value=None makes psutil swallow NoSuchProcess/AccessDenied
+    # internally for dead or protected processes, so no Python-level
+    # try/except is needed per process
+    for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'cpu_percent', 'cmdline', 'create_time'],
+                                    ad_value=None):
+        proc_info = proc.info
+        proc_name = (proc_info['name'] or '').lower()
+
+        # Look for VS Code related processes
+        if any(keyword in proc_name for keyword in [
+            'code', 'electron', 'visual studio code'
+        ]):
+            # Additional check to make sure it's actually VS Code
+            cmdline = proc_info['cmdline'] or []
+            if any('visual studio code' in arg.lower() or
+                  'vscode' in arg.lower() or
+                  'code' in arg.lower() for arg in cmdline):
+
+                # Determine process type based on command line arguments
+                process_type = determine_process_type(cmdline, proc_name)
+
+                vscode_processes.append({
+                    'process': proc,
+                    'type': process_type,
+                    'name': proc_info['name'],
+                    'cmdline': cmdline,
+                    # Prefetched by process_iter; snapshot consumers can
+                    # use these without another round-trip per process
+                    'memory_info': proc_info['memory_info'],
+                    'cpu_percent': proc_info['cpu_percent'] or 0.0
+                })
+
+    _process_scan_cache['data'] = vscode_processes
+    _process_scan_cache['time'] = now
     return vscode_processes
 
 def determine_process_type(cmdline, proc_name):
@@ -112,6 +178,7 @@ def detect_copilot_related_processes(process_data):
 
 def analyze_copilot_git_hypothesis(process_data):
     """Analyze memory usage patterns to test Copilot + Git interaction hypothesis"""
+    import psutil
     print("\n🔍 COPILOT + GIT MEMORY INTERACTION ANALYSIS")
     print("=" * 80)
     
@@ -184,9 +251,10 @@ def analyze_copilot_git_hypothesis(process_data):
         print(f"   • Total Extension Host memory: {format_bytes(total_ext_memory)}")
         print(f"   • Average per Extension Host: {format_bytes(avg_ext_memory)}")
         
-        # Check for high memory extension hosts
-        high_memory_ext = [p for p in extension_hosts if p['rss'] > 200 * 1024 * 1024]
-        if high_memory_ext:
+        # Check for high memory extension hosts; any() short-circuits on the
+        # first hit, so the common no-anomaly case is a single early-exit scan
+        if any(p['rss'] > MB_200 for p in extension_hosts):
+            high_memory_ext = [p for p in extension_hosts if p['rss'] > MB_200]
             print(f"   ⚠️  High memory Extension Hosts detected: {len(high_memory_ext)}")
             for ext in high_memory_ext:
                 print(f"      - PID {ext['pid']}: {format_bytes(ext['rss'])}")
@@ -202,8 +270,8 @@ def analyze_copilot_git_hypothesis(process_data):
         print(f"   • Total Git process memory: {format_bytes(total_git_memory)}")
         
         # Check for memory growth patterns
-        git_with_high_uptime = [p for p in git_processes if p['uptime'] > 3600]  # 1 hour
-        if git_with_high_uptime:
+        if any(p['uptime'] > 3600 for p in git_processes):  # 1 hour
+            git_with_high_uptime = [p for p in git_processes if p['uptime'] > 3600]
             print(f"   ⚠️  Long-running Git processes: {len(git_with_high_uptime)}")
     else:
         print(f"\n📈 H2 - Git Integration Analysis:")
@@ -260,8 +328,7 @@ def analyze_copilot_git_hypothesis(process_data):
         flags_str = ','.join(flags) if flags else '-'
         uptime_str = f"{proc['uptime']/3600:.1f}h" if proc['uptime'] > 0 else "N/A"
         
-        memory_mb = proc['rss'] / (1024 * 1024)
-        indicator = "🔥" if memory_mb > 200 else "⚠️" if memory_mb > 100 else "📊"
+        indicator = "🔥" if proc['rss'] > MB_200 else "⚠️" if proc['rss'] > MB_100 else "📊"
         
         print(f"{indicator} {i:2d} {proc['pid']:6d} "
               f"{format_bytes(proc['rss']):>10s} "
@@ -295,6 +362,8 @@ def format_bytes(bytes_value):
 
 def monitor_memory_with_hypothesis(interval=15, duration=600, focus="4"):
     """Monitor VS Code memory usage with focus on Copilot+Git hypothesis"""
+    import psutil
+    from datetime import datetime
     focus_names = {
         "1": "Extension Hosts (Copilot UI)",
         "2": "Git Processes",
@@ -306,20 +375,23 @@ def monitor_memory_with_hypothesis(interval=15, duration=600, focus="4"):
     print(f"📊 Checking every {interval} seconds for {duration} seconds")
     print("=" * 120)
     
-    start_time = time.time()
+    start_time = time.monotonic()
+    deadline = start_time + duration
+    next_tick = start_time
     measurements = []
     baseline_memory = {}
     
     try:
         measurement_count = 0
-        while time.time() - start_time < duration:
+        while time.monotonic() < deadline:
             measurement_count += 1
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            timestamp = f"{datetime.now():%H:%M:%S}"
             process_data = get_vscode_processes()
             
             if not process_data:
                 print(f"[{timestamp}] ❌ No VS Code processes found")
-                time.sleep(interval)
+                next_tick += interval
+                time.sleep(max(0.0, next_tick - time.monotonic()))
                 continue
             
             # Analyze processes for hypothesis
@@ -337,7 +409,8 @@ def monitor_memory_with_hypothesis(interval=15, duration=600, focus="4"):
             
             if not target_processes:
                 print(f"[{timestamp}] ❌ No target processes found for focus area")
-                time.sleep(interval)
+                next_tick += interval
+                time.sleep(max(0.0, next_tick - time.monotonic()))
                 continue
             
             # Collect detailed information
@@ -360,14 +433,11 @@ def monitor_memory_with_hypothesis(interval=15, duration=600, focus="4"):
                     except (psutil.AccessDenied, psutil.NoSuchProcess):
                         open_files = threads = 0
                     
-                    # Calculate memory growth since baseline
-                    memory_growth = 0
-                    growth_percentage = 0
-                    if proc.pid in baseline_memory:
-                        memory_growth = rss - baseline_memory[proc.pid]
-                        growth_percentage = (memory_growth / baseline_memory[proc.pid]) * 100 if baseline_memory[proc.pid] > 0 else 0
-                    else:
-                        baseline_memory[proc.pid] = rss
+                    # Calculate memory growth since baseline; one setdefault
+                    # replaces the membership test and repeated lookups
+                    baseline = baseline_memory.setdefault(proc.pid, rss)
+                    memory_growth = rss - baseline
+                    growth_percentage = (memory_growth / baseline) * 100 if baseline > 0 else 0
                     
                     processes_with_memory.append({
                         'pid': proc.pid,
@@ -406,8 +476,7 @@ def monitor_memory_with_hypothesis(interval=15, duration=600, focus="4"):
                 flags_str = ','.join(flags) if flags else '-'
                 
                 # Highlight concerning patterns
-                memory_mb = proc['rss'] / (1024 * 1024)
-                growth_indicator = "📈" if proc['growth_percentage'] > 10 else "🔥" if memory_mb > 200 else "📊"
+                growth_indicator = "📈" if proc['growth_percentage'] > 10 else "🔥" if proc['rss'] > MB_200 else "📊"
                 
                 print(f"{growth_indicator} {i:2d} {proc['pid']:6d} "
                       f"{format_bytes(proc['rss']):>10s} "
@@ -438,7 +507,8 @@ def monitor_memory_with_hypothesis(interval=15, duration=600, focus="4"):
                 'high_growth_count': len(high_growth_processes)
             })
             
-            time.sleep(interval)
+            next_tick += interval
+            time.sleep(max(0.0, next_tick - time.monotonic()))
             
     except KeyboardInterrupt:
         print("\n\n⏹️  Hypothesis monitoring stopped by user")
@@ -503,56 +573,66 @@ def monitor_memory_with_hypothesis(interval=15, duration=600, focus="4"):
         
         return measurements
 
+def sample_process(proc_data):
+    """Fetch one process's memory/CPU sample; None if it vanished"""
+    import psutil
+    try:
+        proc = proc_data['process']
+        memory_info = proc.memory_info()
+        cpu_percent = proc.cpu_percent()
+
+        return {
+            'pid': proc.pid,
+            'type': proc_data['type'],
+            'name': proc_data['name'],
+            'rss': memory_info.rss,  # Resident Set Size (physical memory)
+            'vms': memory_info.vms,  # Virtual Memory Size
+            'cpu': cpu_percent
+        }
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return None
+
 def monitor_memory(interval=5, duration=60):
     """Monitor VS Code memory usage with detailed process breakdown"""
+    import psutil
+    from concurrent.futures import ThreadPoolExecutor
+    from datetime import datetime
     print(f"🔍 Monitoring VS Code memory usage...")
     print(f"📊 Checking every {interval} seconds for {duration} seconds")
     print("=" * 100)
     
-    start_time = time.time()
+    start_time = time.monotonic()
+    deadline = start_time + duration
+    next_tick = start_time
     measurements = []
     
     try:
-        while time.time() - start_time < duration:
-            timestamp = datetime.now().strftime("%H:%M:%S")
+        while time.monotonic() < deadline:
+            timestamp = f"{datetime.now():%H:%M:%S}"
             process_data = get_vscode_processes()
             
             if not process_data:
                 print(f"[{timestamp}] ❌ No VS Code processes found")
-                time.sleep(interval)
+                next_tick += interval
+                time.sleep(max(0.0, next_tick - time.monotonic()))
                 continue
             
             total_memory = 0
             total_cpu = 0
             process_count = len(process_data)
             
-            # Sort processes by memory usage (highest first)
-            processes_with_memory = []
-            
-            for proc_data in process_data:
-                try:
-                    proc = proc_data['process']
-                    memory_info = proc.memory_info()
-                    cpu_percent = proc.cpu_percent()
-                    
-                    rss = memory_info.rss  # Resident Set Size (physical memory)
-                    vms = memory_info.vms  # Virtual Memory Size
-                    
-                    total_memory += rss
-                    total_cpu += cpu_percent
-                    
-                    processes_with_memory.append({
-                        'pid': proc.pid,
-                        'type': proc_data['type'],
-                        'name': proc_data['name'],
-                        'rss': rss,
-                        'vms': vms,
-                        'cpu': cpu_percent
-                    })
-                    
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
+            # Fan the per-process reads across a thread pool; psutil
+            # releases the GIL around its syscalls, so the independent
+            # /proc (or Windows API) reads overlap instead of serializing
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                samples = list(executor.map(sample_process, process_data))
+
+            processes_with_memory = [s for s in samples if s is not None]
+
+            for proc_info in processes_with_memory:
+                total_memory += proc_info['rss']
+                total_cpu += proc_info['cpu']
+
             # Sort by memory usage (RSS) descending
             processes_with_memory.sort(key=lambda x: x['rss'], reverse=True)
             
@@ -563,7 +643,7 @@ def monitor_memory(interval=5, duration=60):
             
             for i, proc_info in enumerate(processes_with_memory, 1):
                 # Highlight high memory processes
-                memory_indicator = "🔥" if proc_info['rss'] > 200 * 1024 * 1024 else "📊"  # 200MB threshold
+                memory_indicator = _ICONS[proc_info['rss'] > MB_200]  # 200MB threshold
                 
                 print(f"{memory_indicator} {i:2d} {proc_info['pid']:6d} "
                       f"{format_bytes(proc_info['rss']):>12s} "
@@ -593,7 +673,8 @@ def monitor_memory(interval=5, duration=60):
                 'processes': processes_with_memory.copy()
             })
             
-            time.sleep(interval)
+            next_tick += interval
+            time.sleep(max(0.0, next_tick - time.monotonic()))
             
     except KeyboardInterrupt:
         print("\n\n⏹️  Monitoring stopped by user")
@@ -655,7 +736,7 @@ def monitor_memory(interval=5, duration=60):
             max_mem = stats['max_memory']
             count = stats['count']
             
-            indicator = "🔥" if avg_mem > 200 * 1024 * 1024 else "📊"
+            indicator = _ICONS[avg_mem > MB_200]
             print(f"{indicator} {proc_type:<23} "
                   f"{format_bytes(avg_mem):>12s} "
                   f"{format_bytes(max_mem):>12s} "
@@ -664,7 +745,7 @@ def monitor_memory(interval=5, duration=60):
         # Memory usage recommendations
         print(f"\n💡 RECOMMENDATIONS:")
         high_memory_types = [t for t, s in sorted_types 
-                           if s['total_memory'] / s['count'] > 200 * 1024 * 1024]
+                           if s['total_memory'] / s['count'] > MB_200]
         
         if high_memory_types:
             print("   High memory usage detected in:")
@@ -680,6 +761,7 @@ def monitor_memory(interval=5, duration=60):
 
 def analyze_repo_memory_usage(process_data):
     """Analyze memory usage specifically for large repository scenarios"""
+    import psutil
     print("🔍 ANALYZING MEMORY USAGE FOR LARGE REPOSITORY")
     print("=" * 80)
     
@@ -735,8 +817,7 @@ def analyze_repo_memory_usage(process_data):
     print("-" * 120)
     
     for i, proc in enumerate(processes_with_memory[:10], 1):  # Top 10
-        memory_mb = proc['rss'] / (1024 * 1024)
-        indicator = "🔥" if memory_mb > 200 else "⚠️" if memory_mb > 100 else "📊"
+        indicator = "🔥" if proc['rss'] > MB_200 else "⚠️" if proc['rss'] > MB_100 else "📊"
         
         # Extract useful details from command line
         details = extract_process_details(proc['cmdline'], proc['type'])
@@ -801,7 +882,7 @@ def analyze_repo_memory_usage(process_data):
     recommendations = []
     
     # Check for high memory window processes
-    high_memory_windows = [p for p in window_processes if p['rss'] > 500 * 1024 * 1024]  # 500MB
+    high_memory_windows = [p for p in window_processes if p['rss'] > MB_500]  # 500MB
     if high_memory_windows:
         issues_found.append(f"High memory window processes: {len(high_memory_windows)}")
         recommendations.extend([
@@ -820,9 +901,8 @@ def analyze_repo_memory_usage(process_data):
         ])
     
     # Check total memory usage
-    total_gb = total_memory / (1024 * 1024 * 1024)
-    if total_gb > 2:
-        issues_found.append(f"High total memory usage: {total_gb:.1f}GB")
+    if total_memory > GB_2:
+        issues_found.append(f"High total memory usage: {total_memory / (1024 * 1024 * 1024):.1f}GB")
         recommendations.extend([
             "Restart VS Code periodically",
             "Close and reopen the workspace",
@@ -887,12 +967,16 @@ def extract_process_details(cmdline, proc_type):
 
 def monitor_freeze_patterns(interval=5, duration=600):
     """Monitor memory patterns associated with UI freezing during Copilot usage"""
+    import psutil
+    from datetime import datetime
     print(f"🧊 Monitoring UI Freeze Patterns...")
     print(f"📊 Checking every {interval} seconds for {duration} seconds")
     print("🎯 Focus: Memory oscillations, CPU spikes, and process behavior during freezes")
     print("=" * 120)
     
-    start_time = time.time()
+    start_time = time.monotonic()
+    deadline = start_time + duration
+    next_tick = start_time
     measurements = []
     freeze_events = []
     
@@ -901,14 +985,15 @@ def monitor_freeze_patterns(interval=5, duration=600):
     
     try:
         measurement_count = 0
-        while time.time() - start_time < duration:
+        while time.monotonic() < deadline:
             measurement_count += 1
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            timestamp = f"{datetime.now():%H:%M:%S}"
             process_data = get_vscode_processes()
             
             if not process_data:
                 print(f"[{timestamp}] ❌ No VS Code processes found")
-                time.sleep(interval)
+                next_tick += interval
+                time.sleep(max(0.0, next_tick - time.monotonic()))
                 continue
             
             # Collect process data with focus on key processes
@@ -967,11 +1052,11 @@ def monitor_freeze_patterns(interval=5, duration=600):
                 freeze_indicators.append(f"HIGH-CPU: {len(high_cpu_processes)} processes")
             if memory_spikes:
                 freeze_indicators.append(f"MEM-SPIKE: {len(memory_spikes)} processes")
-            if total_memory > 3 * 1024 * 1024 * 1024:  # 3GB threshold
+            if total_memory > GB_3:  # 3GB threshold
                 freeze_indicators.append("HIGH-TOTAL-MEM")
             
             # Display current state
-            status_icon = "🔥" if freeze_indicators else "📊"
+            status_icon = _ICONS[bool(freeze_indicators)]
             print(f"\n[{timestamp}] {status_icon} Measurement #{measurement_count} - Total RAM: {format_bytes(total_memory)}")
             
             if freeze_indicators:
@@ -999,7 +1084,7 @@ def monitor_freeze_patterns(interval=5, duration=600):
                     status_parts.append(f"SPIKE+{spike['increase_pct']:.0f}%")
                 
                 status = " | ".join(status_parts) if status_parts else "-"
-                cpu_icon = "🔥" if proc['cpu'] > 50 else "📊"
+                cpu_icon = _ICONS[proc['cpu'] > 50]
                 
                 print(f"{cpu_icon} {i:2d} {proc['pid']:6d} "
                       f"{format_bytes(proc['rss']):>12s} "
@@ -1025,7 +1110,8 @@ def monitor_freeze_patterns(interval=5, duration=600):
                 'processes': current_processes.copy()
             })
             
-            time.sleep(interval)
+            next_tick += interval
+            time.sleep(max(0.0, next_tick - time.monotonic()))
             
     except KeyboardInterrupt:
         print("\n\n⏹️  Freeze pattern monitoring stopped by user")
@@ -1289,20 +1375,25 @@ def run_git_isolation_test():
 
 def monitor_git_isolation_phase(phase_name, duration=300, interval=10):
     """Monitor memory during a specific phase of Git isolation testing"""
+    import psutil
+    from datetime import datetime
     print(f"🔍 Monitoring Phase: {phase_name}")
     print(f"📊 Duration: {duration}s, Interval: {interval}s")
     print("=" * 60)
     
-    start_time = time.time()
+    start_time = time.monotonic()
+    deadline = start_time + duration
+    next_tick = start_time
     measurements = []
     
-    while time.time() - start_time < duration:
-        timestamp = datetime.now().strftime("%H:%M:%S")
+    while time.monotonic() < deadline:
+        timestamp = f"{datetime.now():%H:%M:%S}"
         process_data = get_vscode_processes()
         
         if not process_data:
             print(f"[{timestamp}] ❌ No VS Code processes found")
-            time.sleep(interval)
+            next_tick += interval
+            time.sleep(max(0.0, next_tick - time.monotonic()))
             continue
         
         # Collect key metrics
@@ -1359,7 +1450,8 @@ def monitor_git_isolation_phase(phase_name, duration=300, interval=10):
             'process_breakdown': process_breakdown.copy()
         })
         
-        time.sleep(interval)
+        next_tick += interval
+        time.sleep(max(0.0, next_tick - time.monotonic()))
     
     return {
         'phase': phase_name,
@@ -1391,73 +1483,82 @@ def compare_git_isolation_results(baseline_results, no_git_results):
         print("❌ No measurement data available for comparison")
         return
     
-    print("📊 GIT ISOLATION TEST RESULTS")
-    print("=" * 60)
-    
+    # Buffer the report and emit it with a single write - one syscall
+    # instead of one per line
+    buf = io.StringIO()
+    buf.write("📊 GIT ISOLATION TEST RESULTS\n")
+    buf.write("=" * 60 + "\n")
+
     # Memory comparison
     if baseline_measurements and no_git_measurements:
         baseline_avg = sum(m['total_memory'] for m in baseline_measurements) / len(baseline_measurements)
         baseline_max = max(m['total_memory'] for m in baseline_measurements)
         baseline_window_avg = sum(m['window_memory'] for m in baseline_measurements) / len(baseline_measurements)
-        
+
         no_git_avg = sum(m['total_memory'] for m in no_git_measurements) / len(no_git_measurements)
         no_git_max = max(m['total_memory'] for m in no_git_measurements)
         no_git_window_avg = sum(m['window_memory'] for m in no_git_measurements) / len(no_git_measurements)
-        
-        print(f"📈 MEMORY COMPARISON:")
-        print(f"                    WITH Git    WITHOUT Git    Difference")
-        print(f"   Average Total:   {format_bytes(baseline_avg):>10s}  {format_bytes(no_git_avg):>10s}  {((no_git_avg/baseline_avg-1)*100):+6.1f}%")
-        print(f"   Maximum Total:   {format_bytes(baseline_max):>10s}  {format_bytes(no_git_max):>10s}  {((no_git_max/baseline_max-1)*100):+6.1f}%")
-        print(f"   Window Process:  {format_bytes(baseline_window_avg):>10s}  {format_bytes(no_git_window_avg):>10s}  {((no_git_window_avg/baseline_window_avg-1)*100):+6.1f}%")
-        
+
+        buf.write(f"📈 MEMORY COMPARISON:\n")
+        buf.write(f"                    WITH Git    WITHOUT Git    Difference\n")
+        buf.write(f"   Average Total:   {format_bytes(baseline_avg):>10s}  {format_bytes(no_git_avg):>10s}  {((no_git_avg/baseline_avg-1)*100):+6.1f}%\n")
+        buf.write(f"   Maximum Total:   {format_bytes(baseline_max):>10s}  {format_bytes(no_git_max):>10s}  {((no_git_max/baseline_max-1)*100):+6.1f}%\n")
+        buf.write(f"   Window Process:  {format_bytes(baseline_window_avg):>10s}  {format_bytes(no_git_window_avg):>10s}  {((no_git_window_avg/baseline_window_avg-1)*100):+6.1f}%\n")
+
         # Determine results
         memory_reduction = (baseline_avg - no_git_avg) / baseline_avg
-        
-        print(f"\n🎯 RESULTS INTERPRETATION:")
-        
+
+        buf.write(f"\n🎯 RESULTS INTERPRETATION:\n")
+
         if memory_reduction > 0.2:  # 20% reduction
-            print("✅ SIGNIFICANT IMPROVEMENT: Git removal reduced memory usage by >20%")
-            print("   → Git integration was a major contributor to memory issues")
-            print("   → Consider optimizing Git settings or using external Git")
+            buf.write("✅ SIGNIFICANT IMPROVEMENT: Git removal reduced memory usage by >20%\n")
+            buf.write("   → Git integration was a major contributor to memory issues\n")
+            buf.write("   → Consider optimizing Git settings or using external Git\n")
         elif memory_reduction > 0.1:  # 10% reduction
-            print("⚠️  MODERATE IMPROVEMENT: Git removal reduced memory usage by 10-20%")
-            print("   → Git integration contributes to memory issues but isn't the only cause")
-            print("   → Investigate other factors like Copilot context size")
+            buf.write("⚠️  MODERATE IMPROVEMENT: Git removal reduced memory usage by 10-20%\n")
+            buf.write("   → Git integration contributes to memory issues but isn't the only cause\n")
+            buf.write("   → Investigate other factors like Copilot context size\n")
         elif abs(memory_reduction) < 0.1:  # Less than 10% change
-            print("❌ NO SIGNIFICANT CHANGE: Memory usage similar with/without Git")
-            print("   → Git integration is NOT the primary cause of memory issues")
-            print("   → Focus on Copilot settings, language servers, or VS Code configuration")
+            buf.write("❌ NO SIGNIFICANT CHANGE: Memory usage similar with/without Git\n")
+            buf.write("   → Git integration is NOT the primary cause of memory issues\n")
+            buf.write("   → Focus on Copilot settings, language servers, or VS Code configuration\n")
         else:  # Memory increased without Git
-            print("🤔 UNEXPECTED RESULT: Memory usage increased without Git")
-            print("   → This suggests Git integration was actually helping manage memory")
-            print("   → Other processes may be compensating for missing Git functionality")
-        
-        print(f"\n💡 RECOMMENDATIONS:")
+            buf.write("🤔 UNEXPECTED RESULT: Memory usage increased without Git\n")
+            buf.write("   → This suggests Git integration was actually helping manage memory\n")
+            buf.write("   → Other processes may be compensating for missing Git functionality\n")
+
+        buf.write(f"\n💡 RECOMMENDATIONS:\n")
         if memory_reduction > 0.1:
-            print("   • Optimize Git integration settings:")
-            print('     - "git.autorefresh": false')
-            print('     - "files.watcherExclude": {"**/.git/**": true}')
-            print("   • Consider using Git from command line for large repos")
-            print("   • Experiment with Git-related VS Code extensions")
+            buf.write("   • Optimize Git integration settings:\n")
+            buf.write('     - "git.autorefresh": false\n')
+            buf.write('     - "files.watcherExclude": {"**/.git/**": true}\n')
+            buf.write("   • Consider using Git from command line for large repos\n")
+            buf.write("   • Experiment with Git-related VS Code extensions\n")
         else:
-            print("   • Git is not the bottleneck - focus on:")
-            print("   • Copilot context size and query patterns")
-            print("   • Language server configurations")
-            print("   • VS Code memory settings and limits")
-            print("   • System RAM and performance optimization")
-    
+            buf.write("   • Git is not the bottleneck - focus on:\n")
+            buf.write("   • Copilot context size and query patterns\n")
+            buf.write("   • Language server configurations\n")
+            buf.write("   • VS Code memory settings and limits\n")
+            buf.write("   • System RAM and performance optimization\n")
+
     else:
-        print("📊 Partial data available - manual observation needed")
-        print("   Compare your experience:")
-        print("   • Did UI freezing improve without Git?")
-        print("   • Were Copilot operations more responsive?")
-        print("   • Did memory usage feel more stable?")
+        buf.write("📊 Partial data available - manual observation needed\n")
+        buf.write("   Compare your experience:\n")
+        buf.write("   • Did UI freezing improve without Git?\n")
+        buf.write("   • Were Copilot operations more responsive?\n")
+        buf.write("   • Did memory usage feel more stable?\n")
+
+    sys.stdout.write(buf.getvalue())
 
 def analyze_copilot_focused_memory(process_data):
     """Analyze memory usage with focus on Copilot after ruling out Git"""
-    print("\n🤖 COPILOT-FOCUSED MEMORY ANALYSIS (Post-Git Isolation)")
-    print("=" * 80)
-    print("Git has been ruled out as primary cause. Focusing on Copilot-specific issues.")
+    import psutil
+    # Accumulate the whole report in one buffer and flush it with a single
+    # write at the end
+    buf = io.StringIO()
+    buf.write("\n🤖 COPILOT-FOCUSED MEMORY ANALYSIS (Post-Git Isolation)\n")
+    buf.write("=" * 80 + "\n")
+    buf.write("Git has been ruled out as primary cause. Focusing on Copilot-specific issues.\n")
     
     # Collect detailed process information
     processes_with_memory = []
@@ -1471,22 +1572,26 @@ def analyze_copilot_focused_memory(process_data):
     for proc_data in process_data:
         try:
             proc = proc_data['process']
-            memory_info = proc.memory_info()
-            cpu_percent = proc.cpu_percent()
-            
+            # One batched as_dict call replaces five per-attribute round-trips
+            # and the inner try/except: attributes we are denied come back as
+            # None instead of raising
+            info = proc.as_dict(
+                attrs=['memory_info', 'cpu_percent', 'open_files',
+                       'num_threads', 'create_time'],
+                ad_value=None)
+            memory_info = info['memory_info']
+            if memory_info is None:
+                continue
+            cpu_percent = info['cpu_percent'] or 0.0
+
             rss = memory_info.rss
             vms = memory_info.vms
             total_memory += rss
-            
-            # Get additional process info
-            try:
-                open_files = len(proc.open_files())
-                threads = proc.num_threads()
-                create_time = proc.create_time()
-                uptime = time.time() - create_time
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                open_files = threads = uptime = 0
-            
+
+            open_files = len(info['open_files']) if info['open_files'] is not None else 0
+            threads = info['num_threads'] or 0
+            uptime = time.time() - info['create_time'] if info['create_time'] else 0
+
             proc_info = {
                 'pid': proc.pid,
                 'type': proc_data['type'],
@@ -1516,89 +1621,90 @@ def analyze_copilot_focused_memory(process_data):
     # Sort by memory usage
     processes_with_memory.sort(key=lambda x: x['rss'], reverse=True)
     
-    print(f"📊 Total VS Code Memory Usage: {format_bytes(total_memory)}")
-    print(f"🔢 Total Processes: {len(processes_with_memory)}")
-    
+    buf.write(f"📊 Total VS Code Memory Usage: {format_bytes(total_memory)}\n")
+    buf.write(f"🔢 Total Processes: {len(processes_with_memory)}\n")
+
     # Extension Host Analysis (Primary Copilot suspects)
-    print(f"\n🎯 EXTENSION HOST ANALYSIS (Primary Copilot Processes):")
-    print("-" * 80)
-    
+    buf.write(f"\n🎯 EXTENSION HOST ANALYSIS (Primary Copilot Processes):\n")
+    buf.write("-" * 80 + "\n")
+
     if extension_hosts:
         total_ext_memory = sum(p['rss'] for p in extension_hosts)
         ext_percentage = (total_ext_memory / total_memory) * 100
-        
-        print(f"📈 Extension Hosts Summary:")
-        print(f"   • Count: {len(extension_hosts)}")
-        print(f"   • Total Memory: {format_bytes(total_ext_memory)} ({ext_percentage:.1f}% of total)")
-        print(f"   • Average per Extension Host: {format_bytes(total_ext_memory / len(extension_hosts))}")
-        
-        # Check for problematic extension hosts
-        high_memory_exts = [p for p in extension_hosts if p['rss'] > 100 * 1024 * 1024]  # 100MB
-        if high_memory_exts:
-            print(f"\n⚠️  HIGH MEMORY EXTENSION HOSTS:")
+
+        buf.write(f"📈 Extension Hosts Summary:\n")
+        buf.write(f"   • Count: {len(extension_hosts)}\n")
+        buf.write(f"   • Total Memory: {format_bytes(total_ext_memory)} ({ext_percentage:.1f}% of total)\n")
+        buf.write(f"   • Average per Extension Host: {format_bytes(total_ext_memory / len(extension_hosts))}\n")
+
+        # Check for problematic extension hosts; any() short-circuits so the
+        # list is only built when something actually exceeds the threshold
+        if any(p['rss'] > MB_100 for p in extension_hosts):  # 100MB
+            high_memory_exts = [p for p in extension_hosts if p['rss'] > MB_100]
+            buf.write(f"\n⚠️  HIGH MEMORY EXTENSION HOSTS:\n")
             for ext in high_memory_exts:
                 uptime_str = f"{ext['uptime']/3600:.1f}h" if ext['uptime'] > 0 else "N/A"
-                print(f"   • PID {ext['pid']}: {format_bytes(ext['rss'])} "
-                      f"(CPU: {ext['cpu']:.1f}%, Uptime: {uptime_str})")
+                buf.write(f"   • PID {ext['pid']}: {format_bytes(ext['rss'])} "
+                          f"(CPU: {ext['cpu']:.1f}%, Uptime: {uptime_str})\n")
         else:
-            print(f"   ✅ Extension Host memory usage appears normal")
+            buf.write(f"   ✅ Extension Host memory usage appears normal\n")
     else:
-        print(f"   ❌ No Extension Host processes found")
-    
+        buf.write(f"   ❌ No Extension Host processes found\n")
+
     # Language Server Analysis
-    print(f"\n🔍 LANGUAGE SERVER ANALYSIS:")
-    print("-" * 80)
-    
+    buf.write(f"\n🔍 LANGUAGE SERVER ANALYSIS:\n")
+    buf.write("-" * 80 + "\n")
+
     if language_servers:
         total_ls_memory = sum(p['rss'] for p in language_servers)
         ls_percentage = (total_ls_memory / total_memory) * 100
-        
-        print(f"📈 Language Servers Summary:")
-        print(f"   • Count: {len(language_servers)}")
-        print(f"   • Total Memory: {format_bytes(total_ls_memory)} ({ls_percentage:.1f}% of total)")
-        
+
+        buf.write(f"📈 Language Servers Summary:\n")
+        buf.write(f"   • Count: {len(language_servers)}\n")
+        buf.write(f"   • Total Memory: {format_bytes(total_ls_memory)} ({ls_percentage:.1f}% of total)\n")
+
         # Check for high CPU language servers (sign of overwork)
-        high_cpu_ls = [p for p in language_servers if p['cpu'] > 5]
-        if high_cpu_ls:
-            print(f"\n⚠️  HIGH CPU LANGUAGE SERVERS:")
+        if any(p['cpu'] > 5 for p in language_servers):
+            high_cpu_ls = [p for p in language_servers if p['cpu'] > 5]
+            buf.write(f"\n⚠️  HIGH CPU LANGUAGE SERVERS:\n")
             for ls in high_cpu_ls:
-                print(f"   • PID {ls['pid']}: {format_bytes(ls['rss'])} "
-                      f"(CPU: {ls['cpu']:.1f}%)")
-        
+                buf.write(f"   • PID {ls['pid']}: {format_bytes(ls['rss'])} "
+                          f"(CPU: {ls['cpu']:.1f}%)\n")
+
         # Check for language servers with many open files
-        high_file_ls = [p for p in language_servers if p['open_files'] > 100]
-        if high_file_ls:
-            print(f"\n📁 LANGUAGE SERVERS WITH MANY OPEN FILES:")
+        if any(p['open_files'] > 100 for p in language_servers):
+            high_file_ls = [p for p in language_servers if p['open_files'] > 100]
+            buf.write(f"\n📁 LANGUAGE SERVERS WITH MANY OPEN FILES:\n")
             for ls in high_file_ls:
-                print(f"   • PID {ls['pid']}: {ls['open_files']} files, {format_bytes(ls['rss'])}")
+                buf.write(f"   • PID {ls['pid']}: {ls['open_files']} files, {format_bytes(ls['rss'])}\n")
     else:
-        print(f"   ❌ No Language Server processes found")
-    
+        buf.write(f"   ❌ No Language Server processes found\n")
+
     # Window Process Analysis
-    print(f"\n🪟 WINDOW/EDITOR PROCESS ANALYSIS:")
-    print("-" * 80)
-    
+    buf.write(f"\n🪟 WINDOW/EDITOR PROCESS ANALYSIS:\n")
+    buf.write("-" * 80 + "\n")
+
     if window_processes:
         total_window_memory = sum(p['rss'] for p in window_processes)
         window_percentage = (total_window_memory / total_memory) * 100
-        
-        print(f"📈 Window Processes Summary:")
-        print(f"   • Count: {len(window_processes)}")
-        print(f"   • Total Memory: {format_bytes(total_window_memory)} ({window_percentage:.1f}% of total)")
-        
+
+        buf.write(f"📈 Window Processes Summary:\n")
+        buf.write(f"   • Count: {len(window_processes)}\n")
+        buf.write(f"   • Total Memory: {format_bytes(total_window_memory)} ({window_percentage:.1f}% of total)\n")
+
         # Check for very high memory window processes
-        huge_windows = [p for p in window_processes if p['rss'] > 500 * 1024 * 1024]  # 500MB
-        if huge_windows:
-            print(f"\n🔥 EXTREMELY HIGH MEMORY WINDOW PROCESSES:")
+        if any(p['rss'] > MB_500 for p in window_processes):  # 500MB
+            huge_windows = [p for p in window_processes if p['rss'] > MB_500]
+            buf.write(f"\n🔥 EXTREMELY HIGH MEMORY WINDOW PROCESSES:\n")
             for win in huge_windows:
-                print(f"   • PID {win['pid']}: {format_bytes(win['rss'])}")
-                print(f"     This likely indicates excessive context loading for Copilot")
-    
+                buf.write(f"   • PID {win['pid']}: {format_bytes(win['rss'])}\n")
+                buf.write(f"     This likely indicates excessive context loading for Copilot\n")
+
     # Top memory consumers with Copilot focus
-    print(f"\n🏆 TOP MEMORY CONSUMERS (Copilot Perspective):")
-    print("-" * 100)
-    print(f"{'#':>2} {'PID':>6} {'RAM':>10} {'CPU':>5} {'Files':>5} {'Threads':>7} {'Copilot Relevance':<20} {'Type':<20}")
-    print("-" * 100)
+    buf.write(f"\n🏆 TOP MEMORY CONSUMERS (Copilot Perspective):\n")
+    buf.write("-" * 100 + "\n")
+    buf.write(f"{'#':>2} {'PID':>6} {'RAM':>10} {'CPU':>5} {'Files':>5} {'Threads':>7} {'Copilot Relevance':<20} {'Type':<20}\n")
+    buf.write("-" * 100 + "\n")
     
     for i, proc in enumerate(processes_with_memory[:8], 1):
         # Determine Copilot relevance
@@ -1612,45 +1718,47 @@ def analyze_copilot_focused_memory(process_data):
         elif 'GPU Process' in proc['type']:
             relevance = "LOW (Graphics only)"
         
-        memory_mb = proc['rss'] / (1024 * 1024)
-        indicator = "🔥" if memory_mb > 200 else "⚠️" if memory_mb > 100 else "📊"
-        
-        print(f"{indicator} {i:2d} {proc['pid']:6d} "
-              f"{format_bytes(proc['rss']):>10s} "
-              f"{proc['cpu']:4.1f}% "
-              f"{proc['open_files']:4d} "
-              f"{proc['threads']:6d} "
-              f"{relevance:<20s} "
-              f"{proc['type']:<20s}")
-    
+        indicator = "🔥" if proc['rss'] > MB_200 else "⚠️" if proc['rss'] > MB_100 else "📊"
+
+        buf.write(f"{indicator} {i:2d} {proc['pid']:6d} "
+                  f"{format_bytes(proc['rss']):>10s} "
+                  f"{proc['cpu']:4.1f}% "
+                  f"{proc['open_files']:4d} "
+                  f"{proc['threads']:6d} "
+                  f"{relevance:<20s} "
+                  f"{proc['type']:<20s}\n")
+
     # Copilot-specific recommendations
-    print(f"\n💡 COPILOT-SPECIFIC RECOMMENDATIONS:")
-    
-    total_gb = total_memory / (1024 * 1024 * 1024)
-    if total_gb > 2:
-        print("   🔥 HIGH TOTAL MEMORY USAGE DETECTED")
-        print("   • Primary suspect: Copilot context size in large repository")
-        print("   • Try reducing Copilot context scope")
-        print("   • Consider workspace-specific Copilot settings")
-    
-    if extension_hosts and any(p['rss'] > 200 * 1024 * 1024 for p in extension_hosts):
-        print("   ⚠️  HIGH EXTENSION HOST MEMORY")
-        print("   • Copilot extension may be accumulating context")
-        print("   • Try restarting Extension Host: Ctrl+Shift+P → 'Developer: Restart Extension Host'")
-    
+    buf.write(f"\n💡 COPILOT-SPECIFIC RECOMMENDATIONS:\n")
+
+    if total_memory > GB_2:
+        buf.write("   🔥 HIGH TOTAL MEMORY USAGE DETECTED\n")
+        buf.write("   • Primary suspect: Copilot context size in large repository\n")
+        buf.write("   • Try reducing Copilot context scope\n")
+        buf.write("   • Consider workspace-specific Copilot settings\n")
+
+    if extension_hosts and any(p['rss'] > MB_200 for p in extension_hosts):
+        buf.write("   ⚠️  HIGH EXTENSION HOST MEMORY\n")
+        buf.write("   • Copilot extension may be accumulating context\n")
+        buf.write("   • Try restarting Extension Host: Ctrl+Shift+P → 'Developer: Restart Extension Host'\n")
+
     if language_servers and any(p['cpu'] > 10 for p in language_servers):
-        print("   ⚠️  LANGUAGE SERVERS OVERLOADED")
-        print("   • Large repository causing continuous analysis")
-        print("   • Consider excluding directories from language server scanning")
-    
-    print(f"\n🎯 NEXT TESTING STEPS:")
-    print("   1. Test with smaller Copilot queries")
-    print("   2. Try disabling Copilot temporarily")
-    print("   3. Monitor during specific Copilot operations")
-    print("   4. Test with reduced VS Code workspace scope")
+        buf.write("   ⚠️  LANGUAGE SERVERS OVERLOADED\n")
+        buf.write("   • Large repository causing continuous analysis\n")
+        buf.write("   • Consider excluding directories from language server scanning\n")
+
+    buf.write(f"\n🎯 NEXT TESTING STEPS:\n")
+    buf.write("   1. Test with smaller Copilot queries\n")
+    buf.write("   2. Try disabling Copilot temporarily\n")
+    buf.write("   3. Monitor during specific Copilot operations\n")
+    buf.write("   4. Test with reduced VS Code workspace scope\n")
+
+    sys.stdout.write(buf.getvalue())
 
 def monitor_copilot_processes(focus="extension_hosts", duration=300, interval=10):
     """Monitor processes with focus on Copilot-specific behavior"""
+    import psutil
+    from datetime import datetime
     focus_descriptions = {
         "extension_hosts": "Extension Host processes (where Copilot runs)",
         "query_testing": "Memory behavior during Copilot queries",
@@ -1677,23 +1785,32 @@ def monitor_copilot_processes(focus="extension_hosts", duration=300, interval=10
     
     print("=" * 100)
     
-    start_time = time.time()
+    start_time = time.monotonic()
+    deadline = start_time + duration
+    next_tick = start_time
     measurements = []
     baseline_memory = {}
-    
+
+    # Running sums maintained alongside measurements so the final analysis
+    # doesn't need extra O(N) passes over the history
+    sum_total_memory = 0
+    sum_copilot_memory = 0
+    sum_high_growth = 0
+
     try:
         measurement_count = 0
-        while time.time() - start_time < duration:
+        while time.monotonic() < deadline:
             measurement_count += 1
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            timestamp = f"{datetime.now():%H:%M:%S}"
             process_data = get_vscode_processes()
-            
+
             if not process_data:
                 print(f"[{timestamp}] ❌ No VS Code processes found")
-                time.sleep(interval)
+                next_tick += interval
+                time.sleep(max(0.0, next_tick - time.monotonic()))
                 continue
-            
-                       
+
+
             # Filter processes based on focus
             if focus == "extension_hosts":
                 target_processes = [p for p in process_data if 'Extension Host' in p['type']]
@@ -1702,14 +1819,16 @@ def monitor_copilot_processes(focus="extension_hosts", duration=300, interval=10
             
             if not target_processes:
                 print(f"[{timestamp}] ❌ No target processes found")
-                time.sleep(interval)
+                next_tick += interval
+                time.sleep(max(0.0, next_tick - time.monotonic()))
                 continue
             
             # Analyze current memory state
             current_memory = {}
             total_memory = 0
             copilot_relevant_memory = 0
-            
+            high_growth = []
+
             for proc_data in target_processes:
                 try:
                     proc = proc_data['process']
@@ -1723,14 +1842,12 @@ def monitor_copilot_processes(focus="extension_hosts", duration=300, interval=10
                     if any(keyword in proc_data['type'] for keyword in ['Extension Host', 'Window', 'Language Server']):
                         copilot_relevant_memory += rss
                     
-                    # Calculate growth since baseline
-                    growth = 0
-                    growth_pct = 0
-                    if proc.pid in baseline_memory:
-                        growth = rss - baseline_memory[proc.pid]
-                        growth_pct = (growth / baseline_memory[proc.pid]) * 100 if baseline_memory[proc.pid] > 0 else 0
-                    else:
-                        baseline_memory[proc.pid] = rss
+                    # Calculate growth since baseline; setdefault makes this
+                    # one dict operation instead of a membership test plus up
+                    # to three lookups (first sighting yields growth 0)
+                    baseline = baseline_memory.setdefault(proc.pid, rss)
+                    growth = rss - baseline
+                    growth_pct = (growth / baseline) * 100 if baseline > 0 else 0
                     
                     current_memory[proc.pid] = {
                         'type': proc_data['type'],
@@ -1739,41 +1856,50 @@ def monitor_copilot_processes(focus="extension_hosts", duration=300, interval=10
                         'growth': growth,
                         'growth_pct': growth_pct
                     }
-                    
+                    # Flag high growth while we are here rather than
+                    # re-scanning current_memory afterwards
+                    if growth_pct > 20:
+                        high_growth.append(proc.pid)
+
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
             
-            # Display results
-            print(f"\n[{timestamp}] 🤖 Measurement #{measurement_count}")
-            print(f"Total Memory: {format_bytes(total_memory)} | "
-                  f"Copilot-Relevant: {format_bytes(copilot_relevant_memory)} | "
-                  f"Processes: {len(current_memory)}")
-            
+            # Display results - buffer the whole section and write it once
+            buf = io.StringIO()
+            buf.write(f"\n[{timestamp}] 🤖 Measurement #{measurement_count}\n")
+            buf.write(f"Total Memory: {format_bytes(total_memory)} | "
+                      f"Copilot-Relevant: {format_bytes(copilot_relevant_memory)} | "
+                      f"Processes: {len(current_memory)}\n")
+
             # Show top processes with growth information
-            sorted_processes = sorted(current_memory.items(), 
+            sorted_processes = sorted(current_memory.items(),
                                     key=lambda x: x[1]['rss'], reverse=True)
-            
+
             if sorted_processes:
-                print("-" * 90)
-                print(f"{'PID':>6} {'RAM':>10} {'Growth':>8} {'%':>6} {'CPU':>5} {'Type':<20}")
-                print("-" * 90)
-                
+                buf.write("-" * 90 + "\n")
+                buf.write(f"{'PID':>6} {'RAM':>10} {'Growth':>8} {'%':>6} {'CPU':>5} {'Type':<20}\n")
+                buf.write("-" * 90 + "\n")
+
                 for pid, info in sorted_processes[:5]:  # Top 5
-                    growth_indicator = "📈" if info['growth_pct'] > 10 else "🔥" if info['rss'] > 200*1024*1024 else "📊"
-                    
-                    print(f"{growth_indicator} {pid:6d} "
-                          f"{format_bytes(info['rss']):>10s} "
-                          f"{format_bytes(info['growth']):>8s} "
-                          f"{info['growth_pct']:5.1f}% "
-                          f"{info['cpu']:4.1f}% "
-                          f"{info['type']:<20s}")
-            
+                    growth_indicator = "📈" if info['growth_pct'] > 10 else "🔥" if info['rss'] > MB_200 else "📊"
+
+                    buf.write(f"{growth_indicator} {pid:6d} "
+                              f"{format_bytes(info['rss']):>10s} "
+                              f"{format_bytes(info['growth']):>8s} "
+                              f"{info['growth_pct']:5.1f}% "
+                              f"{info['cpu']:4.1f}% "
+                              f"{info['type']:<20s}\n")
+
             # Check for concerning patterns
-            high_growth = [pid for pid, info in current_memory.items() if info['growth_pct'] > 20]
             if high_growth:
-                print(f"⚠️  HIGH GROWTH DETECTED: {len(high_growth)} process(es)")
+                buf.write(f"⚠️  HIGH GROWTH DETECTED: {len(high_growth)} process(es)\n")
+
+            sys.stdout.write(buf.getvalue())
             
-            # Store measurement
+            # Store measurement and keep the running sums up to date
+            sum_total_memory += total_memory
+            sum_copilot_memory += copilot_relevant_memory
+            sum_high_growth += len(high_growth)
             measurements.append({
                 'timestamp': timestamp,
                 'measurement': measurement_count,
@@ -1783,360 +1909,395 @@ def monitor_copilot_processes(focus="extension_hosts", duration=300, interval=10
                 'high_growth_count': len(high_growth)
             })
             
-            time.sleep(interval)
+            next_tick += interval
+            time.sleep(max(0.0, next_tick - time.monotonic()))
             
     except KeyboardInterrupt:
         print("\n\n⏹️  Copilot monitoring stopped by user")
     
     # Analysis
     if measurements:
-        print("\n" + "=" * 100)
-        print("🤖 COPILOT MONITORING ANALYSIS")
-        print("=" * 100)
-        
+        buf = io.StringIO()
+        buf.write("\n" + "=" * 100 + "\n")
+        buf.write("🤖 COPILOT MONITORING ANALYSIS\n")
+        buf.write("=" * 100 + "\n")
+
         initial_memory = measurements[0]['total_memory']
         final_memory = measurements[-1]['total_memory']
         memory_change = final_memory - initial_memory
         memory_change_pct = (memory_change / initial_memory) * 100 if initial_memory > 0 else 0
-        
-        print(f"📈 MEMORY TREND:")
-        print(f"   Initial: {format_bytes(initial_memory)}")
-        print(f"   Final: {format_bytes(final_memory)}")
-        print(f"   Change: {format_bytes(memory_change)} ({memory_change_pct:+.1f}%)")
-        
-        avg_copilot_memory = sum(m['copilot_relevant_memory'] for m in measurements) / len(measurements)
-        copilot_percentage = (avg_copilot_memory / (sum(m['total_memory'] for m in measurements) / len(measurements))) * 100
-        
-        print(f"\n🎯 COPILOT-RELEVANT PROCESSES:")
-        print(f"   Average Copilot-relevant memory: {format_bytes(avg_copilot_memory)}")
-        print(f"   Percentage of total: {copilot_percentage:.1f}%")
-        
+
+        buf.write(f"📈 MEMORY TREND:\n")
+        buf.write(f"   Initial: {format_bytes(initial_memory)}\n")
+        buf.write(f"   Final: {format_bytes(final_memory)}\n")
+        buf.write(f"   Change: {format_bytes(memory_change)} ({memory_change_pct:+.1f}%)\n")
+
+        avg_copilot_memory = sum_copilot_memory / len(measurements)
+        copilot_percentage = (avg_copilot_memory / (sum_total_memory / len(measurements))) * 100
+
+        buf.write(f"\n🎯 COPILOT-RELEVANT PROCESSES:\n")
+        buf.write(f"   Average Copilot-relevant memory: {format_bytes(avg_copilot_memory)}\n")
+        buf.write(f"   Percentage of total: {copilot_percentage:.1f}%\n")
+
         # Growth events
-        high_growth_events = sum(m['high_growth_count'] for m in measurements)
+        high_growth_events = sum_high_growth
         if high_growth_events > 0:
-            print(f"\n⚠️  GROWTH EVENTS: {high_growth_events} detected during monitoring")
-            print("   This suggests active memory accumulation")
-        
-        print(f"\n💡 COPILOT OPTIMIZATION RECOMMENDATIONS:")
-        
+            buf.write(f"\n⚠️  GROWTH EVENTS: {high_growth_events} detected during monitoring\n")
+            buf.write("   This suggests active memory accumulation\n")
+
+        buf.write(f"\n💡 COPILOT OPTIMIZATION RECOMMENDATIONS:\n")
+
         if memory_change_pct > 10:
-            print("   🔥 MEMORY GROWTH DETECTED")
-            print("   • Copilot appears to accumulate memory over time")
-            print("   • Try restarting Extension Host periodically")
-            print("   • Consider reducing Copilot context settings")
-        
+            buf.write("   🔥 MEMORY GROWTH DETECTED\n")
+            buf.write("   • Copilot appears to accumulate memory over time\n")
+            buf.write("   • Try restarting Extension Host periodically\n")
+            buf.write("   • Consider reducing Copilot context settings\n")
+
         if copilot_percentage > 60:
-            print("   ⚠️  COPILOT PROCESSES DOMINATE MEMORY")
-            print("   • Extension Hosts and related processes use majority of memory")
-            print("   • Focus optimization efforts on Copilot settings")
-        
+            buf.write("   ⚠️  COPILOT PROCESSES DOMINATE MEMORY\n")
+            buf.write("   • Extension Hosts and related processes use majority of memory\n")
+            buf.write("   • Focus optimization efforts on Copilot settings\n")
+
         if high_growth_events > len(measurements) * 0.2:
-            print("   🚨 FREQUENT MEMORY SPIKES")
-            print("   • Memory growth events happening frequently")
-            print("   • Investigate specific Copilot operations causing spikes")
+            buf.write("   🚨 FREQUENT MEMORY SPIKES\n")
+            buf.write("   • Memory growth events happening frequently\n")
+            buf.write("   • Investigate specific Copilot operations causing spikes\n")
+
+        sys.stdout.write(buf.getvalue())
+
+def print_help():
+    """Print usage information"""
+    print("VS Code Memory Monitor\n"
+          "Usage: python test.py [options] [interval] [duration]\n"
+          "Options:\n"
+          "  -h, --help: show this help\n"
+          "  -y, --yes: skip confirmation prompts (for automated runs)\n"
+          "  --interval N: override a mode's check interval in seconds\n"
+          "  --duration N: override a mode's total monitoring time in seconds\n"
+          "  -s, --snapshot: take a single detailed snapshot\n"
+          "  -r, --repo-analysis: analyze memory usage for large repository\n"
+          "  -c, --copilot-analysis: analyze Copilot + Git memory hypothesis\n"
+          "  -f, --freeze-detection: monitor UI freeze patterns\n"
+          "  -g, --git-isolation: test memory patterns with/without Git integration\n"
+          "  --copilot-focused: continuous monitoring focused on Copilot processes\n"
+          "  --copilot-context-test: test impact of Copilot context size on memory\n"
+          "  --copilot-optimization: generate Copilot optimization recommendations\n"
+          "  interval: seconds between checks (default: 5)\n"
+          "  duration: total monitoring time in seconds (default: 60)\n"
+          "\n"
+          "Examples:\n"
+          "  python test.py --snapshot\n"
+          "  python test.py --repo-analysis\n"
+          "  python test.py --copilot-analysis\n"
+          "  python test.py --freeze-detection\n"
+          "  python test.py --git-isolation\n"
+          "  python test.py --copilot-focused\n"
+          "  python test.py --copilot-context-test\n"
+          "  python test.py --copilot-optimization\n"
+          "  python test.py 3 30    # Monitor for 30s with 3s intervals")
+
+def run_copilot_focused_mode():
+    """Copilot-focused continuous monitoring"""
+    print("🤖 COPILOT-FOCUSED MONITORING MODE\n"
+          + "=" * 60 + "\n"
+          "This mode continuously monitors VS Code with focus on\n"
+          "Copilot-related processes and Extension Host memory.\n\n"
+          "📋 What this monitors:\n"
+          "• Extension Host processes (where Copilot runs)\n"
+          "• Language Server processes\n"
+          "• Copilot-specific processes\n"
+          "• Main VS Code processes\n"
+          "• Memory growth patterns\n")
+
+    if confirm("❓ Start Copilot-focused monitoring? (y/N): "):
+        print("\n🔄 Starting Copilot-focused monitoring...")
+        print("   (Press Ctrl+C to stop)")
+        monitor_copilot_focused()
+
+def run_copilot_context_test_mode():
+    """Test Copilot context impact on memory"""
+    print("🧪 COPILOT CONTEXT IMPACT TESTING\n"
+          + "=" * 60 + "\n"
+          "This mode tests the hypothesis that Copilot context size\n"
+          "directly impacts Extension Host memory usage.\n\n"
+          "📋 Testing Protocol:\n"
+          "1. Measure baseline memory with current settings\n"
+          "2. You'll use Copilot heavily (suggestions, chat, etc.)\n"
+          "3. Measure memory during heavy Copilot usage\n"
+          "4. Calculate impact and provide recommendations\n")
+
+    if confirm("❓ Start Copilot context impact test? (y/N): "):
+        print("\n🔄 Starting Copilot context impact test...")
+        test_copilot_context_impact()
+
+def run_copilot_optimization_mode():
+    """Generate Copilot optimization recommendations"""
+    print("🎯 COPILOT OPTIMIZATION REPORT\n"
+          + "=" * 60 + "\n"
+          "This mode analyzes your current VS Code + Copilot setup\n"
+          "and provides specific optimization recommendations.\n")
+
+    if confirm("❓ Generate Copilot optimization report? (y/N): "):
+        print("\n🔄 Generating optimization report...")
+        generate_copilot_optimization_report()
+
+def run_git_isolation_mode():
+    """Git isolation testing mode"""
+    print("🔬 GIT ISOLATION TESTING MODE\n"
+          + "=" * 80 + "\n"
+          "This mode tests whether Git integration is the primary cause\n"
+          "of memory issues during Copilot usage in large repositories.\n\n"
+          "📋 TESTING PROTOCOL:\n"
+          "1. First, we'll monitor WITH Git integration (baseline)\n"
+          "2. Then, we'll help you temporarily disable Git\n"
+          "3. Finally, we'll monitor WITHOUT Git integration\n"
+          "4. Compare results to isolate Git's impact\n\n"
+          "⚠️  SAFETY NOTES:\n"
+          "• Git folder will be temporarily moved, not deleted\n"
+          "• Easy restoration with simple command\n"
+          "• No risk of data loss\n")
+
+    if confirm("❓ Start Git isolation testing? (y/N): "):
+        print("\n🔄 Starting Git isolation testing...")
+        run_git_isolation_test()
+
+def run_freeze_detection_mode():
+    """UI Freeze detection mode"""
+    print("🧊 UI FREEZE DETECTION MODE\n"
+          + "=" * 80 + "\n"
+          "This mode monitors for memory patterns associated with UI freezing\n"
+          "during Copilot interactions in large repositories.\n\n"
+          "📋 Instructions:\n"
+          "1. Start this monitoring\n"
+          "2. Use Copilot normally in your large repository\n"
+          "3. When UI freezes occur, note the timestamp\n"
+          "4. Let monitoring run through freeze events\n"
+          "5. Review correlation patterns\n")
+
+    if confirm("❓ Start freeze detection monitoring? (y/N): "):
+        print("\n🔄 Starting freeze detection monitoring...")
+        print("   (Press Ctrl+C to stop)")
+        monitor_freeze_patterns(interval=MONITOR_INTERVAL or 5,
+                                duration=MONITOR_DURATION or 600)  # 10 minutes with 5s intervals
+
+def run_copilot_analysis_mode():
+    """Copilot + Git hypothesis analysis"""
+    print("🧪 COPILOT + GIT MEMORY HYPOTHESIS TESTING\n"
+          + "=" * 80 + "\n"
+          "This mode tests specific hypotheses about Copilot and Git\n"
+          "interactions causing memory issues in large repositories.\n")
+
+    # Take initial snapshot
+    print("📸 Taking initial snapshot for hypothesis testing...")
+    process_data = get_vscode_processes()
+
+    if not process_data:
+        print("❌ No VS Code processes found")
+        print("Make sure VS Code is running with Copilot enabled.")
+        return
+
+    # Run hypothesis analysis
+    processes_with_memory = analyze_copilot_git_hypothesis(process_data)
+
+    # Offer targeted monitoring
+    print("\n🔄 TARGETED MONITORING OPTIONS:\n"
+          "1. Monitor Extension Hosts (Copilot UI hypothesis)\n"
+          "2. Monitor Git processes (Git integration hypothesis)\n"
+          "3. Monitor Language Servers (re-parsing hypothesis)\n"
+          "4. Monitor all processes with hypothesis flags\n"
+          "5. Skip continuous monitoring")
+
+    choice = input("\nSelect monitoring option (1-5): ").strip()
+
+    if choice in ['1', '2', '3', '4']:
+        print(f"\n🔄 Starting targeted monitoring...")
+        print("   (Press Ctrl+C to stop)")
+        monitor_memory_with_hypothesis(interval=MONITOR_INTERVAL or 15,
+                                       duration=MONITOR_DURATION or 600,
+                                       focus=choice)  # 10 minutes
+
+def run_repo_analysis_mode():
+    """Repository-specific analysis"""
+    print("🔍 LARGE REPOSITORY MEMORY ANALYSIS\n"
+          + "=" * 80 + "\n"
+          "This mode provides detailed analysis for VS Code memory usage\n"
+          "when working with large repositories.\n")
+
+    # Take initial snapshot
+    print("📸 Taking initial snapshot...")
+    process_data = get_vscode_processes()
+
+    if not process_data:
+        print("❌ No VS Code processes found")
+        print("Make sure VS Code is running with your large repository open.")
+        return
+
+    # Analyze current state
+    analyze_repo_memory_usage(process_data)
+
+    # Offer continuous monitoring
+    if confirm("\n❓ Would you like to start continuous monitoring? (y/N): "):
+        print("\n🔄 Starting continuous monitoring...")
+        print("   (Press Ctrl+C to stop)")
+        monitor_memory(interval=MONITOR_INTERVAL or 10,
+                       duration=MONITOR_DURATION or 300)  # 5 minutes with 10s intervals
+
+def run_snapshot_mode():
+    """Single snapshot mode with detailed breakdown"""
+    from collections import defaultdict
+    from datetime import datetime
+
+    print("📸 Taking a detailed memory snapshot...")
+    process_data = get_vscode_processes()
+
+    if not process_data:
+        print("❌ No VS Code processes found")
+        return
+
+    timestamp = f"{datetime.now():%Y-%m-%d %H:%M:%S}"
+    total_memory = 0
+
+    # Collect and sort process information, aggregating the per-type
+    # breakdown in the same pass instead of re-walking the list later
+    processes_with_memory = []
+    # Per-type [memory, count] slots; the defaultdict factory replaces the
+    # membership check and dict allocation on first sight of a type
+    type_breakdown = defaultdict(lambda: [0, 0])
+    for proc_data in process_data:
+        # memory_info and cpu_percent were prefetched by process_iter
+        # in get_vscode_processes; no per-process round-trip or
+        # try/except needed here
+        memory_info = proc_data['memory_info']
+        if memory_info is None:
+            continue
+        cpu_percent = proc_data['cpu_percent']
+        rss = memory_info.rss
+        vms = memory_info.vms
+        total_memory += rss
+
+        # Precompute the formatted strings and the high-memory
+        # flag here so the print pass is pure f-string
+        # substitution
+        processes_with_memory.append({
+            'pid': proc_data['process'].pid,
+            'type': proc_data['type'],
+            'name': proc_data['name'],
+            'rss': rss,
+            'vms': vms,
+            'cpu': cpu_percent,
+            'rss_fmt': format_bytes(rss),
+            'vms_fmt': format_bytes(vms),
+            'hot': rss > MB_200
+        })
+
+        slot = type_breakdown[proc_data['type']]
+        slot[0] += rss
+        slot[1] += 1
+
+    # Sort by memory usage; itemgetter keeps the key in C
+    processes_with_memory.sort(key=itemgetter('rss'), reverse=True)
+
+    # Build the whole table in a list and emit it with one write so the
+    # output is a single syscall rather than one print per process
+    lines = [
+        f"\n[{timestamp}] Found {len(processes_with_memory)} VS Code process(es):",
+        "=" * 100,
+        f"{'#':>2} {'PID':>6} {'RAM':>12} {'Virtual':>12} {'CPU':>6} {'Process Type':<25}",
+        "=" * 100,
+    ]
+
+    for i, proc_info in enumerate(processes_with_memory, 1):
+        memory_indicator = _ICONS[proc_info['hot']]
+
+        lines.append(f"{memory_indicator} {i:2d} {proc_info['pid']:6d} "
+                     f"{proc_info['rss_fmt']:>12s} "
+                     f"{proc_info['vms_fmt']:>12s} "
+                     f"{proc_info['cpu']:5.1f}% "
+                     f"{proc_info['type']:<25}")
+
+    lines.append("=" * 100)
+    lines.append(f"📊 TOTAL RAM: {format_bytes(total_memory)}")
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+    # Breakdown by process type was aggregated during collection
+    print(f"\n🔍 BREAKDOWN BY PROCESS TYPE:")
+    print("-" * 60)
+    sorted_breakdown = sorted(type_breakdown.items(), key=lambda x: x[1][0], reverse=True)
+
+    for proc_type, (type_memory, type_count) in sorted_breakdown:
+        percentage = (type_memory / total_memory) * 100
+        indicator = _ICONS[percentage > 20]
+        print(f"{indicator} {proc_type:<25} "
+              f"{format_bytes(type_memory):>10s} "
+              f"({percentage:4.1f}%) "
+              f"[{type_count} process{'es' if type_count > 1 else ''}]")
+
+    # Recommendations for high memory usage
+    high_memory_total = sum(proc['rss'] for proc in processes_with_memory
+                          if proc['hot'])
+
+    if high_memory_total > 0:
+        print(f"\n⚠️  HIGH MEMORY USAGE DETECTED:")
+        print(f"   Total high-memory processes: {format_bytes(high_memory_total)}")
+        print(f"   Recommendations:")
+        print(f"   • Close unused tabs and windows")
+        print(f"   • Disable heavy extensions temporarily")
+        print(f"   • Consider restarting VS Code")
+        print(f"   • Check for memory leaks in extensions")
+
+# Flag-to-handler table: O(1) lookup instead of walking an elif ladder of
+# list-membership tests for every invocation
+DISPATCH = {
+    '-h': print_help,
+    '--help': print_help,
+    '-s': run_snapshot_mode,
+    '--snapshot': run_snapshot_mode,
+    '-r': run_repo_analysis_mode,
+    '--repo-analysis': run_repo_analysis_mode,
+    '-c': run_copilot_analysis_mode,
+    '--copilot-analysis': run_copilot_analysis_mode,
+    '-f': run_freeze_detection_mode,
+    '--freeze-detection': run_freeze_detection_mode,
+    '-g': run_git_isolation_mode,
+    '--git-isolation': run_git_isolation_mode,
+    '--copilot-focused': run_copilot_focused_mode,
+    '--copilot-context-test': run_copilot_context_test_mode,
+    '--copilot-optimization': run_copilot_optimization_mode,
+}
 
 def main():
     """Main function with command line argument handling"""
+    global ASSUME_YES, MONITOR_INTERVAL, MONITOR_DURATION
+    if any(arg in ('-y', '--yes') for arg in sys.argv[1:]):
+        ASSUME_YES = True
+        sys.argv = [arg for arg in sys.argv if arg not in ('-y', '--yes')]
+
+    sys.argv, MONITOR_INTERVAL = extract_int_option(sys.argv, '--interval')
+    sys.argv, MONITOR_DURATION = extract_int_option(sys.argv, '--duration')
+
     if len(sys.argv) > 1:
-        if sys.argv[1] in ['-h', '--help']:
-            print("VS Code Memory Monitor")
-            print("Usage: python test.py [options] [interval] [duration]")
-            print("Options:")
-            print("  -h, --help: show this help")
-            print("  -s, --snapshot: take a single detailed snapshot")
-            print("  -r, --repo-analysis: analyze memory usage for large repository")
-            print("  -c, --copilot-analysis: analyze Copilot + Git memory hypothesis")
-            print("  -f, --freeze-detection: monitor UI freeze patterns")
-            print("  -g, --git-isolation: test memory patterns with/without Git integration")
-            print("  --copilot-focused: continuous monitoring focused on Copilot processes")
-            print("  --copilot-context-test: test impact of Copilot context size on memory")
-            print("  --copilot-optimization: generate Copilot optimization recommendations")
-            print("  interval: seconds between checks (default: 5)")
-            print("  duration: total monitoring time in seconds (default: 60)")
-            print("\nExamples:")
-            print("  python test.py --snapshot")
-            print("  python test.py --repo-analysis")
-            print("  python test.py --copilot-analysis")
-            print("  python test.py --freeze-detection")
-            print("  python test.py --git-isolation")
-            print("  python test.py --copilot-focused")
-            print("  python test.py --copilot-context-test")
-            print("  python test.py --copilot-optimization")
-            print("  python test.py 3 30    # Monitor for 30s with 3s intervals")
-            return
-        elif sys.argv[1] == '--copilot-focused':
-            # Copilot-focused continuous monitoring
-            print("🤖 COPILOT-FOCUSED MONITORING MODE")
-            print("=" * 60)
-            print("This mode continuously monitors VS Code with focus on")
-            print("Copilot-related processes and Extension Host memory.\n")
-            
-            print("📋 What this monitors:")
-            print("• Extension Host processes (where Copilot runs)")
-            print("• Language Server processes")
-            print("• Copilot-specific processes")
-            print("• Main VS Code processes")
-            print("• Memory growth patterns\n")
-            
-            response = input("❓ Start Copilot-focused monitoring? (y/N): ").lower()
-            if response in ['y', 'yes']:
-                print("\n🔄 Starting Copilot-focused monitoring...")
-                print("   (Press Ctrl+C to stop)")
-                time.sleep(1)
-                monitor_copilot_focused()
-            
-            return
-        elif sys.argv[1] == '--copilot-context-test':
-            # Test Copilot context impact on memory
-            print("🧪 COPILOT CONTEXT IMPACT TESTING")
-            print("=" * 60)
-            print("This mode tests the hypothesis that Copilot context size")
-            print("directly impacts Extension Host memory usage.\n")
-            
-            print("📋 Testing Protocol:")
-            print("1. Measure baseline memory with current settings")
-            print("2. You'll use Copilot heavily (suggestions, chat, etc.)")
-            print("3. Measure memory during heavy Copilot usage")
-            print("4. Calculate impact and provide recommendations\n")
-            
-            response = input("❓ Start Copilot context impact test? (y/N): ").lower()
-            if response in ['y', 'yes']:
-                print("\n🔄 Starting Copilot context impact test...")
-                time.sleep(1)
-                test_copilot_context_impact()
-            
-            return
-        elif sys.argv[1] == '--copilot-optimization':
-            # Generate Copilot optimization recommendations
-            print("🎯 COPILOT OPTIMIZATION REPORT")
-            print("=" * 60)
-            print("This mode analyzes your current VS Code + Copilot setup")
-            print("and provides specific optimization recommendations.\n")
-            
-            response = input("❓ Generate Copilot optimization report? (y/N): ").lower()
-            if response in ['y', 'yes']:
-                print("\n🔄 Generating optimization report...")
-                time.sleep(1)
-                generate_copilot_optimization_report()
-            
-            return
-        elif sys.argv[1] in ['-g', '--git-isolation']:
-            # Git isolation testing mode
-            print("🔬 GIT ISOLATION TESTING MODE")
-            print("=" * 80)
-            print("This mode tests whether Git integration is the primary cause")
-            print("of memory issues during Copilot usage in large repositories.\n")
-            
-            print("📋 TESTING PROTOCOL:")
-            print("1. First, we'll monitor WITH Git integration (baseline)")
-            print("2. Then, we'll help you temporarily disable Git")
-            print("3. Finally, we'll monitor WITHOUT Git integration")
-            print("4. Compare results to isolate Git's impact\n")
-            
-            print("⚠️  SAFETY NOTES:")
-            print("• Git folder will be temporarily moved, not deleted")
-            print("• Easy restoration with simple command")
-            print("• No risk of data loss\n")
-            
-            response = input("❓ Start Git isolation testing? (y/N): ").lower()
-            if response in ['y', 'yes']:
-                print("\n🔄 Starting Git isolation testing...")
-                run_git_isolation_test()
-            
-            return
-        elif sys.argv[1] in ['-f', '--freeze-detection']:
-            # UI Freeze detection mode
-            print("🧊 UI FREEZE DETECTION MODE")
-            print("=" * 80)
-            print("This mode monitors for memory patterns associated with UI freezing")
-            print("during Copilot interactions in large repositories.\n")
-            
-            print("📋 Instructions:")
-            print("1. Start this monitoring")
-            print("2. Use Copilot normally in your large repository")
-            print("3. When UI freezes occur, note the timestamp")
-            print("4. Let monitoring run through freeze events")
-            print("5. Review correlation patterns\n")
-            
-            response = input("❓ Start freeze detection monitoring? (y/N): ").lower()
-            if response in ['y', 'yes']:
-                print("\n🔄 Starting freeze detection monitoring...")
-                print("   (Press Ctrl+C to stop)")
-                time.sleep(1)
-                monitor_freeze_patterns(interval=5, duration=600)  # 10 minutes with 5s intervals
-            
-            return
-        elif sys.argv[1] in ['-c', '--copilot-analysis']:
-            # Copilot + Git hypothesis analysis
-            print("🧪 COPILOT + GIT MEMORY HYPOTHESIS TESTING")
-            print("=" * 80)
-            print("This mode tests specific hypotheses about Copilot and Git")
-            print("interactions causing memory issues in large repositories.\n")
-            
-            # Take initial snapshot
-            print("📸 Taking initial snapshot for hypothesis testing...")
-            process_data = get_vscode_processes()
-            
-            if not process_data:
-                print("❌ No VS Code processes found")
-                print("Make sure VS Code is running with Copilot enabled.")
-                return
-            
-            # Run hypothesis analysis
-            processes_with_memory = analyze_copilot_git_hypothesis(process_data)
-            
-            # Offer targeted monitoring
-            print(f"\n🔄 TARGETED MONITORING OPTIONS:")
-            print("1. Monitor Extension Hosts (Copilot UI hypothesis)")
-            print("2. Monitor Git processes (Git integration hypothesis)")
-            print("3. Monitor Language Servers (re-parsing hypothesis)")
-            print("4. Monitor all processes with hypothesis flags")
-            print("5. Skip continuous monitoring")
-            
-            choice = input("\nSelect monitoring option (1-5): ").strip()
-            
-            if choice in ['1', '2', '3', '4']:
-                print(f"\n🔄 Starting targeted monitoring...")
-                print("   (Press Ctrl+C to stop)")
-                time.sleep(1)
-                monitor_memory_with_hypothesis(interval=15, duration=600, focus=choice)  # 10 minutes
-            
-            return
-        elif sys.argv[1] in ['-r', '--repo-analysis']:
-            # Repository-specific analysis
-            print("🔍 LARGE REPOSITORY MEMORY ANALYSIS")
-            print("=" * 80)
-            print("This mode provides detailed analysis for VS Code memory usage")
-            print("when working with large repositories.\n")
-            
-            # Take initial snapshot
-            print("📸 Taking initial snapshot...")
-            process_data = get_vscode_processes()
-            
-            if not process_data:
-                print("❌ No VS Code processes found")
-                print("Make sure VS Code is running with your large repository open.")
-                return
-            
-            # Analyze current state
-            analyze_repo_memory_usage(process_data)
-            
-            # Offer continuous monitoring
-            response = input("\n❓ Would you like to start continuous monitoring? (y/N): ").lower()
-            if response in ['y', 'yes']:
-                print("\n🔄 Starting continuous monitoring...")
-                print("   (Press Ctrl+C to stop)")
-                time.sleep(1)
-                monitor_memory(interval=10, duration=300)  # 5 minutes with 10s intervals
-            
-            return
-        elif sys.argv[1] in ['-s', '--snapshot']:
-            # Single snapshot mode with detailed breakdown
-            print("📸 Taking a detailed memory snapshot...")
-            process_data = get_vscode_processes()
-            
-            if not process_data:
-                print("❌ No VS Code processes found")
-                return
-            
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            total_memory = 0
-            
-            # Collect and sort process information
-            processes_with_memory = []
-            for proc_data in process_data:
-                try:
-                    proc = proc_data['process']
-                    memory_info = proc.memory_info()
-                    cpu_percent = proc.cpu_percent()
-                    rss = memory_info.rss
-                    vms = memory_info.vms
-                    total_memory += rss
-                    
-                    processes_with_memory.append({
-                        'pid': proc.pid,
-                        'type': proc_data['type'],
-                        'name': proc_data['name'],
-                        'rss': rss,
-                        'vms': vms,
-                        'cpu': cpu_percent
-                    })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            # Sort by memory usage
-            processes_with_memory.sort(key=lambda x: x['rss'], reverse=True)
-            
-            print(f"\n[{timestamp}] Found {len(processes_with_memory)} VS Code process(es):")
-            print("=" * 100)
-            print(f"{'#':>2} {'PID':>6} {'RAM':>12} {'Virtual':>12} {'CPU':>6} {'Process Type':<25}")
-            print("=" * 100)
-            
-            for i, proc_info in enumerate(processes_with_memory, 1):
-                memory_indicator = "🔥" if proc_info['rss'] > 200 * 1024 * 1024 else "📊"
-                
-                print(f"{memory_indicator} {i:2d} {proc_info['pid']:6d} "
-                      f"{format_bytes(proc_info['rss']):>12s} "
-                      f"{format_bytes(proc_info['vms']):>12s} "
-                      f"{proc_info['cpu']:5.1f}% "
-                      f"{proc_info['type']:<25}")
-            
-            print("=" * 100)
-            print(f"📊 TOTAL RAM: {format_bytes(total_memory)}")
-            
-            # Show breakdown by process type
-            type_breakdown = {}
-            for proc in processes_with_memory:
-                proc_type = proc['type']
-                if proc_type not in type_breakdown:
-                    type_breakdown[proc_type] = {'memory': 0, 'count': 0}
-                type_breakdown[proc_type]['memory'] += proc['rss']
-                type_breakdown[proc_type]['count'] += 1
-            
-            print(f"\n🔍 BREAKDOWN BY PROCESS TYPE:")
-            print("-" * 60)
-            sorted_breakdown = sorted(type_breakdown.items(), key=lambda x: x[1]['memory'], reverse=True)
-            
-            for proc_type, stats in sorted_breakdown:
-                percentage = (stats['memory'] / total_memory) * 100
-                indicator = "🔥" if percentage > 20 else "📊"
-                print(f"{indicator} {proc_type:<25} "
-                      f"{format_bytes(stats['memory']):>10s} "
-                      f"({percentage:4.1f}%) "
-                      f"[{stats['count']} process{'es' if stats['count'] > 1 else ''}]")
-            
-            # Recommendations for high memory usage
-            high_memory_total = sum(proc['rss'] for proc in processes_with_memory 
-                                  if proc['rss'] > 200 * 1024 * 1024)
-            
-            if high_memory_total > 0:
-                print(f"\n⚠️  HIGH MEMORY USAGE DETECTED:")
-                print(f"   Total high-memory processes: {format_bytes(high_memory_total)}")
-                print(f"   Recommendations:")
-                print(f"   • Close unused tabs and windows")
-                print(f"   • Disable heavy extensions temporarily")
-                print(f"   • Consider restarting VS Code")
-                print(f"   • Check for memory leaks in extensions")
-            
+        handler = DISPATCH.get(sys.argv[1])
+        if handler is not None:
+            handler()
             return
-    
+
     # Parse interval and duration from command line
-    interval = 5
-    duration = 60
-    
+    interval = MONITOR_INTERVAL or 5
+    duration = MONITOR_DURATION or 60
+
     if len(sys.argv) > 1:
         try:
             interval = int(sys.argv[1])
         except ValueError:
             print("❌ Invalid interval value. Using default: 5 seconds")
-    
+
     if len(sys.argv) > 2:
         try:
             duration = int(sys.argv[2])
         except ValueError:
             print("❌ Invalid duration value. Using default: 60 seconds")
-    
+
     monitor_memory(interval, duration)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()